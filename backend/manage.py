@@ -6,7 +6,7 @@ import sys
 def main():
     """Run administrative tasks."""
     # Changed default settings module path to match project structure
-    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'task_analyzer.settings')
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'task_analyzer.settings.dev')
     try:
         from django.core.management import execute_from_command_line
     except ImportError as exc:
@@ -0,0 +1 @@
+# Settings live in base.py, with dev.py and prod.py overrides on top.
@@ -0,0 +1,157 @@
+"""Settings shared by every environment; see dev.py and prod.py."""
+from functools import lru_cache
+from pathlib import Path
+import os
+from dotenv import load_dotenv
+
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent.parent
+
+
+@lru_cache(maxsize=1)
+def _env_once():
+    """
+    Load the project .env into os.environ once; real env vars win.
+    Child processes inherit the _DOTENV_LOADED marker and skip the file, and
+    DJANGO_SKIP_DOTENV=1 disables it where the platform provides the env.
+    """
+    if not (os.environ.get("DJANGO_SKIP_DOTENV") or os.environ.get("_DOTENV_LOADED")):
+        load_dotenv(BASE_DIR / ".env", override=False)
+        os.environ["_DOTENV_LOADED"] = "1"
+    return os.environ
+
+
+_ENV = _env_once()
+_TRUTHY = frozenset({"1", "true", "True", "TRUE", "yes"})
+
+
+def _env_bool(name, default):
+    return _ENV.get(name, default) in _TRUTHY
+
+
+def _env_list(name, default):
+    return tuple(item.strip() for item in _ENV.get(name, default).split(",") if item.strip())
+
+
+SECRET_KEY = _ENV.get("SECRET_KEY", "dev-secret-key")
+# Off unless explicitly enabled with DJANGO_DEBUG=1 (dev.py turns it on).
+DEBUG = _env_bool("DJANGO_DEBUG", "0")
+
+ALLOWED_HOSTS = _env_list("ALLOWED_HOSTS", "*")
+if "*" in ALLOWED_HOSTS:
+    # Any other entry is redundant; a lone "*" lets validate_host() stop at
+    # the first pattern instead of walking the list.
+    ALLOWED_HOSTS = ("*",)
+
+CSRF_TRUSTED_ORIGINS = ("https://*.onrender.com",)
+
+# The admin is opt-in; the API + SPA deployment doesn't need it.
+ENABLE_ADMIN = _env_bool("ENABLE_ADMIN", "0")
+
+INSTALLED_APPS = (
+    "django.contrib.auth",
+    "django.contrib.contenttypes",
+    "django.contrib.sessions",
+    "django.contrib.messages",
+    "django.contrib.staticfiles",
+
+    "rest_framework",
+    "tasks",
+)
+if ENABLE_ADMIN:
+    INSTALLED_APPS = ("django.contrib.admin",) + INSTALLED_APPS
+
+# WhiteNoise goes first so static requests return before any other middleware.
+MIDDLEWARE = (
+    "whitenoise.middleware.WhiteNoiseMiddleware",   # <-- REQUIRED
+    "django.middleware.security.SecurityMiddleware",
+    "django.contrib.sessions.middleware.SessionMiddleware",
+    "django.middleware.common.CommonMiddleware",
+    "django.middleware.csrf.CsrfViewMiddleware",
+    "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "django.contrib.messages.middleware.MessageMiddleware",
+    "django.middleware.clickjacking.XFrameOptionsMiddleware",
+)
+
+ROOT_URLCONF = "task_analyzer.urls"
+
+def _templates(debug):
+    context_processors = [
+        "django.template.context_processors.request",
+        "django.contrib.auth.context_processors.auth",
+        "django.contrib.messages.context_processors.messages",
+    ]
+    if debug:
+        # Collects sql_queries on every render; only worth it in development.
+        context_processors.insert(0, "django.template.context_processors.debug")
+    return [
+        {
+            "BACKEND": "django.template.backends.django.DjangoTemplates",
+            "DIRS": [str(BASE_DIR / "frontend")],         # <-- LOAD index.html
+            "OPTIONS": {
+                # Parse each template once per process instead of on every render.
+                "loaders": [
+                    ("django.template.loaders.cached.Loader", [
+                        "django.template.loaders.filesystem.Loader",
+                        "django.template.loaders.app_directories.Loader",
+                    ]),
+                ],
+                "context_processors": context_processors,
+            },
+        },
+    ]
+
+
+TEMPLATES = _templates(DEBUG)
+
+WSGI_APPLICATION = "task_analyzer.wsgi.application"
+
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": str(BASE_DIR / "backend" / "db.sqlite3"),
+        "ATOMIC_REQUESTS": False,
+        "OPTIONS": {
+            "timeout": 20,
+        },
+    }
+}
+
+REST_FRAMEWORK = {
+    "DEFAULT_PERMISSION_CLASSES": ["rest_framework.permissions.AllowAny"],
+    "DEFAULT_RENDERER_CLASSES": ["tasks.renderers.ORJSONRenderer"],
+    "DEFAULT_PARSER_CLASSES": ["tasks.parsers.ORJSONParser"],
+    "EXCEPTION_HANDLER": "tasks.exceptions.api_exception_handler",
+}
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "tasks-results",
+        "TIMEOUT": 300,
+        "OPTIONS": {"MAX_ENTRIES": 1000},
+    }
+}
+
+STATIC_URL = "/static/"
+
+STATICFILES_DIRS = [
+    str(BASE_DIR / "frontend"),     # <-- script.js + styles.css
+]
+
+STATIC_ROOT = str(BASE_DIR / "staticfiles")
+
+SECURE_REDIRECT_EXEMPT = (r"^static/",)
+
+
+def _static_headers(headers, path, url):
+    # SecurityMiddleware no longer sees static responses; keep its nosniff header.
+    headers["X-Content-Type-Options"] = "nosniff"
+
+
+WHITENOISE_ADD_HEADERS_FUNCTION = _static_headers
+
+# Dev skips manifest hashing; prod.py switches to the manifest storage.
+STATICFILES_STORAGE = "whitenoise.storage.CompressedStaticFilesStorage"
+
+DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
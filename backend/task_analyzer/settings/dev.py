@@ -0,0 +1,6 @@
+"""Local development settings (used by manage.py)."""
+from .base import *  # noqa: F401,F403
+from .base import _env_bool, _templates
+
+DEBUG = _env_bool("DJANGO_DEBUG", "1")
+TEMPLATES = _templates(DEBUG)
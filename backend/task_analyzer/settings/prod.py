@@ -0,0 +1,10 @@
+"""Production settings (used by the WSGI entry point on Render)."""
+from .base import *  # noqa: F401,F403
+
+# collectstatic writes hashed names plus gzip and brotli variants, which
+# WhiteNoise serves straight from disk.
+STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
+
+# Serve only what collectstatic produced; don't rescan files per request.
+WHITENOISE_USE_FINDERS = False
+WHITENOISE_AUTOREFRESH = False
@@ -1,9 +1,16 @@
+from django.conf import settings
 from django.urls import path
-from django.views.generic import TemplateView
-from tasks.views import analyze_tasks, suggest_tasks
+from tasks.views import analyze_tasks, health_check, suggest_tasks
+from .views import index
 
 urlpatterns = [
-    path("", TemplateView.as_view(template_name="index.html")),
+    path("", index),
     path("api/v1/tasks/analyze/", analyze_tasks),
     path("api/v1/tasks/suggest/", suggest_tasks),
+    path("api/v1/health/", health_check),
 ]
+
+if settings.ENABLE_ADMIN:
+    from django.contrib import admin
+
+    urlpatterns.append(path("admin/", admin.site.urls))
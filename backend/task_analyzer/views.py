@@ -0,0 +1,21 @@
+"""Project-level views that don't belong to an app."""
+from django.conf import settings
+from django.http import HttpResponse
+from django.template.loader import render_to_string
+from django.views.decorators.http import require_safe
+
+_index_html = None
+
+
+def render_index():
+    """Render the SPA shell once per process and return the bytes."""
+    global _index_html
+    if _index_html is None or settings.DEBUG:
+        _index_html = render_to_string("index.html").encode()
+    return _index_html
+
+
+@require_safe
+def index(request):
+    """Serve the frontend's index.html from the in-process copy."""
+    return HttpResponse(render_index())
@@ -11,6 +11,13 @@ import os
 
 from django.core.wsgi import get_wsgi_application
 
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'task_analyzer.settings')
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'task_analyzer.settings.prod')
 
-application = get_wsgi_application()
\ No newline at end of file
+application = get_wsgi_application()
+
+# Warm up per-process caches so the first request isn't slower than the rest.
+# With gunicorn --preload this runs once in the master, before forking.
+# The tasks app warms its scorers in TasksConfig.ready().
+from task_analyzer.views import render_index  # noqa: E402
+
+render_index()
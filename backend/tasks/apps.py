@@ -0,0 +1,15 @@
+from django.apps import AppConfig
+
+
+class TasksConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'tasks'
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+        from .signals import configure_sqlite
+        from .scoring import warm_up
+
+        connection_created.connect(configure_sqlite, dispatch_uid='tasks.configure_sqlite')
+        # Score a throwaway batch now rather than on the first request
+        warm_up()
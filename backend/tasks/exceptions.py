@@ -0,0 +1,24 @@
+"""API-wide exception handling."""
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import exception_handler as drf_exception_handler
+from rest_framework.views import set_rollback
+
+
+def api_exception_handler(exc, context):
+    """
+    Let DRF answer the exceptions it knows (parse errors, 404s, ...) and
+    turn anything else into the API's 500 error body.
+    """
+    response = drf_exception_handler(exc, context)
+    if response is not None:
+        return response
+    
+    set_rollback()
+    return Response(
+        {
+            'error': 'Internal server error',
+            'details': str(exc)
+        },
+        status=status.HTTP_500_INTERNAL_SERVER_ERROR
+    )
@@ -1,6 +1,33 @@
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
-from .scoring import TaskScorer
+from .scoring import get_scorer
+
+# Fields that feed into ``complexity_score``; changing any of them marks it stale.
+_SCORING_FIELDS = frozenset({
+    'title', 'description', 'importance', 'estimated_hours', 'due_date'
+})
+
+
+def _apply_scores(tasks):
+    """Fill in complexity_score on unsaved tasks and mark them clean."""
+    for task in tasks:
+        task.complexity_score = task.compute_complexity_score()
+        task.score_dirty = False
+    return tasks
+
+
+class TaskQuerySet(models.QuerySet):
+    """QuerySet with bulk helpers that keep ``complexity_score`` populated."""
+
+    def bulk_create_scored(self, tasks, batch_size=500):
+        """
+        Score all tasks in one pass, then insert them with ``bulk_create``.
+        ``bulk_create`` bypasses ``Task.save``, so scores are filled in here.
+        """
+        tasks = _apply_scores(list(tasks))
+        with transaction.atomic(using=self.db):
+            return self.bulk_create(tasks, batch_size=batch_size)
+
 
 class Task(models.Model):
     """
@@ -34,13 +61,26 @@ class Task(models.Model):
         editable=False,
         help_text="Auto-calculated score from 1-100 indicating task difficulty."
     )
+    score_dirty = models.BooleanField(
+        default=True,
+        editable=False,
+        help_text="Set when scoring fields change; the score is recomputed on next read."
+    )
 
-    def save(self, *args, **kwargs):
+    objects = TaskQuerySet.as_manager()
+
+    @classmethod
+    def prepare_scored(cls, data_list):
         """
-        Override save method to calculate complexity score before persisting.
-        Uses TaskScorer to derive a score from the task's data.
+        Build unsaved tasks from field dicts with their scores precomputed,
+        ready for ``bulk_create``.
+        """
+        return _apply_scores([cls(**data) for data in data_list])
+
+    def compute_complexity_score(self):
+        """
+        Score the task's current data with the shared TaskScorer.
         """
-        scorer = TaskScorer()
         # Build a minimal task representation for scoring
         task_data = {
             "id": self.id or 0,
@@ -52,9 +92,54 @@ class Task(models.Model):
             "estimated_hours": getattr(self, "estimated_hours", 2.0),
             "dependencies": [],
         }
-        scored_task = scorer.score_task(task_data, [task_data])
-        self.complexity_score = int(scored_task["priority_score"])
+        scored_task = get_scorer().score_single(task_data)
+        return int(scored_task.priority_score)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_scoring_values = instance._scoring_values()
+        return instance
+
+    def _scoring_values(self):
+        # Read from __dict__ so deferred fields are not fetched just to compare.
+        return {name: self.__dict__.get(name) for name in _SCORING_FIELDS}
+
+    def save(self, *args, **kwargs):
+        """
+        Override save method to invalidate the cached complexity score.
+        Scoring is deferred to ``get_complexity_score``; saves that leave
+        the scoring fields untouched keep the stored score.
+        """
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or _SCORING_FIELDS.intersection(update_fields):
+            current = self._scoring_values()
+            if current != getattr(self, '_loaded_scoring_values', None):
+                self.score_dirty = True
+                if update_fields is not None:
+                    kwargs['update_fields'] = {*update_fields, 'score_dirty'}
+            self._loaded_scoring_values = current
         super().save(*args, **kwargs)
 
+    def get_complexity_score(self):
+        """
+        Return ``complexity_score``, recomputing and storing it if stale.
+        The stored value is written with ``update()`` so ``save`` is not re-entered.
+        """
+        if self.score_dirty:
+            self.complexity_score = self.compute_complexity_score()
+            self.score_dirty = False
+            if self.pk is not None:
+                Task.objects.filter(pk=self.pk).update(
+                    complexity_score=self.complexity_score,
+                    score_dirty=False
+                )
+        return self.complexity_score
+
     def __str__(self):
-        return f"{self.title} (Score: {self.complexity_score})"
\ No newline at end of file
+        # Computed but never persisted here: __str__ must not write to the DB
+        score = (
+            self.compute_complexity_score() if self.score_dirty
+            else self.complexity_score
+        )
+        return f"{self.title} (Score: {score})"
\ No newline at end of file
@@ -0,0 +1,26 @@
+"""orjson-backed JSON renderer for the API."""
+import orjson
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework.renderers import JSONRenderer
+
+# Serializer errors key list items by index, e.g. {0: ['A valid integer...']}.
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Render responses with orjson; types it doesn't know natively (lazy
+    strings, Decimal, ...) go through DRF's JSONEncoder.
+
+    A requested indent (``Accept: application/json; indent=4``) is honoured,
+    but orjson only pretty-prints with two spaces.
+    """
+    _default = staticmethod(JSONEncoder().default)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        option = ORJSON_OPTIONS
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=self._default, option=option)
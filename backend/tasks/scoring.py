@@ -1,7 +1,149 @@
 """Priority scoring helpers for tasks."""
+import heapq
 import math
+from bisect import bisect_right
+from collections import Counter
+from dataclasses import dataclass
 from datetime import datetime, date, timedelta
-from typing import List, Dict, Any, Set, Tuple
+from functools import lru_cache
+from operator import attrgetter
+from typing import List, Dict, Any, Set, Tuple, Mapping, Optional
+
+
+def _urgency_score(days_until_due: int) -> float:
+    """Piecewise urgency for a task due in ``days_until_due`` days."""
+    if days_until_due < 0:
+        # Overdue: linear boost starting high and capping at 100
+        overdue_days = abs(days_until_due)
+        return min(100.0, 80.0 + overdue_days * 4)
+    
+    elif days_until_due == 0:
+        # Due today: maximum urgency
+        return 95.0
+    
+    elif days_until_due <= 3:
+        # Very soon: high urgency with slight decay
+        return 90.0 - (days_until_due * 5)
+    
+    elif days_until_due <= 7:
+        # This week: moderate-high urgency
+        return 70.0 - ((days_until_due - 3) * 5)
+    
+    elif days_until_due <= 14:
+        # Next two weeks: moderate urgency
+        return 50.0 - ((days_until_due - 7) * 2)
+    
+    elif days_until_due <= 30:
+        # This month: declining urgency
+        return max(10.0, 30.0 - ((days_until_due - 14) * 1))
+    
+    else:
+        # Far future: minimal urgency
+        return max(5.0, 20 - (days_until_due / 10))
+
+
+# Urgency hits its 100 cap at 5 days overdue and its floor of 5 at 150 days
+# out, so every possible score is precomputed for the days in between.
+_URGENCY_MIN_DAYS = -5
+_URGENCY_MAX_DAYS = 150
+_URGENCY_SCORES = tuple(
+    _urgency_score(days)
+    for days in range(_URGENCY_MIN_DAYS, _URGENCY_MAX_DAYS + 1)
+)
+
+
+def _importance_score(importance: float) -> float:
+    """Map a 1-10 importance rating onto 0-100."""
+    # Direct mapping with slight non-linear boost for high importance
+    base_score = (importance / 10) * 100
+    
+    # Boost very important tasks slightly
+    if importance >= 8:
+        base_score = min(100.0, base_score * 1.1)
+    
+    return base_score
+
+
+# Ratings are validated to 1-10, so every valid input is precomputed.
+_IMPORTANCE_SCORES = {rating: _importance_score(rating) for rating in range(1, 11)}
+
+
+@lru_cache(maxsize=4096)
+def _parse_due_string(value: str) -> Optional[date]:
+    """Parse a due-date string; repeated strings in a batch parse once."""
+    # Fast path: plain YYYY-MM-DD is parsed in C without strptime
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        pass
+    # Accept ISO strings with time component
+    try:
+        return datetime.fromisoformat(value).date()
+    except ValueError:
+        pass
+    # Non-padded dates such as 2025-1-5
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except ValueError:
+        return None
+
+
+def _normalize_due_date(due_date: Any) -> Optional[date]:
+    """Coerce a due date given as str, datetime or date; None otherwise."""
+    if isinstance(due_date, str):
+        return _parse_due_string(due_date)
+    elif isinstance(due_date, datetime):
+        return due_date.date()
+    elif isinstance(due_date, date):
+        return due_date
+    return None
+
+
+# Scores at or above each threshold move up one priority level.
+_PRIORITY_THRESHOLDS = (50, 75)
+_PRIORITY_LEVELS = ('Low', 'Medium', 'High')
+
+# Order of the factors in TaskScorer.STRATEGY_WEIGHTS vectors
+_FACTORS = ('urgency', 'importance', 'effort', 'dependency')
+
+
+@dataclass(slots=True)
+class ScoredTask:
+    """
+    A task with its scoring metadata, as returned by ``TaskScorer.score_task``.
+    
+    Item access (``scored['priority_score']``) is kept so callers written
+    against the old dict records keep working.
+    """
+    id: Any
+    title: str
+    due_date: date
+    estimated_hours: float
+    importance: int
+    dependencies: List[Any]
+    priority_score: float
+    urgency_score: float
+    importance_score: float
+    effort_score: float
+    dependency_score: float
+    explanation: str
+    priority_level: str
+    days_until_due: int
+    dependent_count: int
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self.__dataclass_fields__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__dataclass_fields__
 
 
 class TaskScorer:
@@ -34,6 +176,12 @@ class TaskScorer:
         }
     }
 
+    # Each strategy's weights as a tuple in _FACTORS order, built once
+    STRATEGY_WEIGHTS = {
+        name: tuple(weights[factor] for factor in _FACTORS)
+        for name, weights in STRATEGIES.items()
+    }
+
     def __init__(self, strategy: str = 'smart_balance'):
         """
         Initialize scorer with a specific strategy.
@@ -43,55 +191,33 @@ class TaskScorer:
         """
         self.strategy = strategy
         self.weights = self.STRATEGIES.get(strategy, self.STRATEGIES['smart_balance'])
+        self.weight_vector = self.STRATEGY_WEIGHTS.get(
+            strategy, self.STRATEGY_WEIGHTS['smart_balance']
+        )
 
-    def calculate_urgency_score(self, due_date: date) -> Tuple[float, int]:
+    def calculate_urgency_score(
+        self, 
+        due_date: date, 
+        today: Optional[date] = None
+    ) -> Tuple[float, int]:
         """
         Calculate urgency based on days until due date.
         Uses exponential scaling for overdue tasks and sigmoid decay for future tasks.
         
         Args:
             due_date: Task due date
+            today: Reference date; defaults to the current date
             
         Returns:
             Tuple of (urgency_score, days_until_due)
         """
-        today = datetime.now().date()
+        if today is None:
+            today = datetime.now().date()
         days_until_due = (due_date - today).days
         
-        if days_until_due < 0:
-            # Overdue: linear boost starting high and capping at 100
-            overdue_days = abs(days_until_due)
-            score = min(100, 80 + overdue_days * 4)
-            return score, days_until_due
-        
-        elif days_until_due == 0:
-            # Due today: maximum urgency
-            return 95.0, days_until_due
-        
-        elif days_until_due <= 3:
-            # Very soon: high urgency with slight decay
-            score = 90 - (days_until_due * 5)
-            return score, days_until_due
-        
-        elif days_until_due <= 7:
-            # This week: moderate-high urgency
-            score = 70 - ((days_until_due - 3) * 5)
-            return score, days_until_due
-        
-        elif days_until_due <= 14:
-            # Next two weeks: moderate urgency
-            score = 50 - ((days_until_due - 7) * 2)
-            return score, days_until_due
-        
-        elif days_until_due <= 30:
-            # This month: declining urgency
-            score = 30 - ((days_until_due - 14) * 1)
-            return max(10, score), days_until_due
-        
-        else:
-            # Far future: minimal urgency
-            score = max(5, 20 - (days_until_due / 10))
-            return score, days_until_due
+        # Clamp into the table's range; scores are flat beyond either end
+        index = min(max(days_until_due, _URGENCY_MIN_DAYS), _URGENCY_MAX_DAYS)
+        return _URGENCY_SCORES[index - _URGENCY_MIN_DAYS], days_until_due
 
     def calculate_importance_score(self, importance: int) -> float:
         """
@@ -103,14 +229,10 @@ class TaskScorer:
         Returns:
             Normalized importance score (0-100)
         """
-        # Direct mapping with slight non-linear boost for high importance
-        base_score = (importance / 10) * 100
-        
-        # Boost very important tasks slightly
-        if importance >= 8:
-            base_score = min(100, base_score * 1.1)
-        
-        return base_score
+        score = _IMPORTANCE_SCORES.get(importance)
+        if score is None:
+            score = _importance_score(importance)
+        return score
 
     def calculate_effort_score(self, estimated_hours: float) -> float:
         """
@@ -139,61 +261,124 @@ class TaskScorer:
             return 40.0
         
         # Long tasks get lower scores
-        score = max(10, 100 - (estimated_hours * 8))
+        score = max(10.0, 100.0 - (estimated_hours * 8))
         return score
 
-    def detect_circular_dependencies(
-        self, 
+    @staticmethod
+    def build_dependency_graph(
         tasks: List[Dict[str, Any]]
-    ) -> Tuple[bool, List[int]]:
+    ) -> Dict[Any, List[Any]]:
         """
-        Detect circular dependencies using depth-first search.
+        Build the dependency adjacency list, one entry per task id.
+        
+        Repeated dependencies within a task are dropped, and tasks sharing
+        an id have their dependencies merged, so every edge of the graph is
+        one "task depends on id" fact.
         
         Args:
             tasks: List of task dictionaries
             
         Returns:
-            Tuple of (has_cycle, cycle_path)
+            Dict mapping task id to the ids it depends on
         """
-        # Build adjacency list
-        task_map = {task.get('id', i): task for i, task in enumerate(tasks)}
-        graph = {
-            task_id: task.get('dependencies', [])
-            for task_id, task in task_map.items()
-        }
+        graph = {}
+        for i, task in enumerate(tasks):
+            dependencies = list(dict.fromkeys(task.get('dependencies') or []))
+            task_id = task.get('id', i)
+            if task_id in graph:
+                graph[task_id] = graph[task_id] + dependencies
+            else:
+                graph[task_id] = dependencies
+        return graph
+
+    @staticmethod
+    def walk_dependencies(
+        graph: Dict[Any, List[Any]]
+    ) -> Tuple[bool, List[Any], Counter]:
+        """
+        Detect cycles and count dependents in a single depth-first walk.
+        
+        Every edge is followed exactly once, so the walk also tallies how
+        many tasks depend on each id. The counts are only complete when no
+        cycle was found.
         
-        visited = set()
-        rec_stack = set()
-        cycle_path = []
-        
-        def dfs(node: int, path: List[int]) -> bool:
-            """
-            Depth-first search to detect cycles.
-            """
-            visited.add(node)
-            rec_stack.add(node)
-            path.append(node)
+        Args:
+            graph: Adjacency list from ``build_dependency_graph``
             
-            for neighbor in graph.get(node, []):
-                if neighbor not in visited:
-                    if dfs(neighbor, path):
-                        return True
-                elif neighbor in rec_stack:
-                    # Found cycle
-                    cycle_start = path.index(neighbor)
-                    cycle_path.extend(path[cycle_start:])
-                    return True
+        Returns:
+            Tuple of (has_cycle, cycle_path, dependent_counts)
+        """
+        # Iterative colored DFS: unvisited nodes are absent from ``color``,
+        # nodes on the current path are GRAY, finished nodes are BLACK.
+        GRAY, BLACK = 1, 2
+        color = {}
+        dependent_counts = Counter()
+        
+        for root in graph:
+            if root in color:
+                continue
             
-            path.pop()
-            rec_stack.remove(node)
-            return False
+            # Explicit stack of (node, neighbor iterator) frames; ``position``
+            # maps each GRAY node to its index on the stack.
+            stack = [(root, iter(graph[root]))]
+            position = {root: 0}
+            color[root] = GRAY
+            
+            while stack:
+                node, neighbors = stack[-1]
+                for neighbor in neighbors:
+                    dependent_counts[neighbor] += 1
+                    state = color.get(neighbor)
+                    if state is None:
+                        color[neighbor] = GRAY
+                        position[neighbor] = len(stack)
+                        stack.append((neighbor, iter(graph.get(neighbor, []))))
+                        break
+                    if state == GRAY:
+                        # Back edge: the cycle is the GRAY path from neighbor
+                        cycle_path = [
+                            frame_node
+                            for frame_node, _ in stack[position[neighbor]:]
+                        ]
+                        return True, cycle_path, dependent_counts
+                else:
+                    # All neighbors explored
+                    stack.pop()
+                    del position[node]
+                    color[node] = BLACK
+        
+        return False, [], dependent_counts
+
+    def analyze_dependencies(
+        self, 
+        tasks: List[Dict[str, Any]]
+    ) -> Tuple[bool, List[Any], Counter]:
+        """
+        Check for cycles and count dependents with one pass over the graph.
         
-        for task_id in graph:
-            if task_id not in visited:
-                if dfs(task_id, []):
-                    return True, cycle_path
+        Args:
+            tasks: List of task dictionaries
+            
+        Returns:
+            Tuple of (has_cycle, cycle_path, dependent_counts)
+        """
+        return self.walk_dependencies(self.build_dependency_graph(tasks))
+
+    def detect_circular_dependencies(
+        self, 
+        tasks: List[Dict[str, Any]]
+    ) -> Tuple[bool, List[Any]]:
+        """
+        Detect circular dependencies using depth-first search.
         
-        return False, []
+        Args:
+            tasks: List of task dictionaries
+            
+        Returns:
+            Tuple of (has_cycle, cycle_path)
+        """
+        has_cycle, cycle_path, _ = self.analyze_dependencies(tasks)
+        return has_cycle, cycle_path
 
     def calculate_dependency_score(
         self, 
@@ -202,7 +387,8 @@ class TaskScorer:
     ) -> Tuple[float, int]:
         """
         Calculate dependency score based on how many tasks depend on this one.
-        Tasks that block others should be prioritized.
+        Tasks that block others should be prioritized. Scans ``tasks`` once;
+        batch callers should use ``count_dependents`` instead.
         
         Args:
             task_id: ID of the task to score
@@ -212,14 +398,25 @@ class TaskScorer:
             Tuple of (dependency_score, dependent_count)
         """
         # Count how many tasks depend on this one
-        dependent_count = 0
-        
-        for task in tasks:
-            dependencies = task.get('dependencies', [])
-            if task_id in dependencies:
-                dependent_count += 1
+        dependent_count = sum(
+            1 for task in tasks
+            if task_id in (task.get('dependencies') or [])
+        )
+        return self.calculate_dependency_score_from_count(dependent_count)
+
+    def calculate_dependency_score_from_count(
+        self, 
+        dependent_count: int
+    ) -> Tuple[float, int]:
+        """
+        Calculate dependency score from a precomputed dependent count.
         
-        # Score based on number of dependents
+        Args:
+            dependent_count: Number of tasks that depend on the task
+            
+        Returns:
+            Tuple of (dependency_score, dependent_count)
+        """
         if dependent_count == 0:
             return 10.0, 0
         elif dependent_count == 1:
@@ -228,104 +425,201 @@ class TaskScorer:
             return 70.0, 2
         else:
             # Multiple dependencies: high priority
-            return min(100, 70 + (dependent_count - 2) * 15), dependent_count
+            return min(100.0, 70.0 + (dependent_count - 2) * 15), dependent_count
+
+    @staticmethod
+    def count_dependents(tasks: List[Dict[str, Any]]) -> Counter:
+        """
+        Count, in a single pass, how many tasks depend on each task id.
+        
+        Args:
+            tasks: List of all tasks
+            
+        Returns:
+            Counter mapping task id to number of dependent tasks
+        """
+        return Counter(
+            dep_id
+            for task in tasks
+            for dep_id in set(task.get('dependencies') or [])
+        )
+
+    @staticmethod
+    def normalize_task(
+        task: Dict[str, Any]
+    ) -> Tuple[Any, Optional[date], Any, Any, List[Any]]:
+        """
+        Pull the scoring inputs out of a task dict in one pass, applying defaults.
+        
+        Args:
+            task: Task dictionary
+            
+        Returns:
+            Tuple of (task_id, due_date, importance, estimated_hours,
+            dependencies); due_date is None when missing or unparseable
+        """
+        get = task.get
+        return (
+            get('id') or hash(get('title', '')),
+            _normalize_due_date(get('due_date')),
+            get('importance', 5) or 5,
+            get('estimated_hours', 2.0) or 2.0,
+            get('dependencies') or [],
+        )
+
+    def score_tasks(
+        self, 
+        tasks: List[Dict[str, Any]],
+        dependent_counts: Optional[Mapping[Any, int]] = None,
+        with_explanation: bool = True
+    ) -> List[ScoredTask]:
+        """
+        Score a whole batch of tasks, sharing per-batch work between them.
+        
+        Dependent counts and "today" are computed once for the batch, so
+        every task is scored against the same date.
+        
+        Args:
+            tasks: List of task dictionaries
+            dependent_counts: Optional counts from ``analyze_dependencies``
+            with_explanation: Whether to build each task's explanation text
+            
+        Returns:
+            ScoredTask records, in input order
+        """
+        if dependent_counts is None:
+            dependent_counts = self.count_dependents(tasks)
+        today = datetime.now().date()
+        return [
+            self.score_task(
+                task, tasks, dependent_counts=dependent_counts, today=today,
+                with_explanation=with_explanation
+            )
+            for task in tasks
+        ]
 
     def score_task(
         self, 
         task: Dict[str, Any], 
-        tasks: List[Dict[str, Any]]
-    ) -> Dict[str, Any]:
+        tasks: List[Dict[str, Any]],
+        dependent_counts: Optional[Mapping[Any, int]] = None,
+        today: Optional[date] = None,
+        with_explanation: bool = True
+    ) -> ScoredTask:
         """
         Calculate comprehensive priority score for a task.
         
         Args:
             task: Task dictionary to score
             tasks: All tasks (for dependency analysis)
+            dependent_counts: Optional precomputed dependents per task id
+            today: Reference date; defaults to the current date
+            with_explanation: If False, leave 'explanation' empty; fill it
+                later with ``explain``
             
         Returns:
-            Task dictionary with added scoring metadata
-        """
-        # Extract task data with defaults
-        task_id = task.get('id') or hash(task.get('title', ''))
-        due_date = task.get('due_date')
-
-        # Normalize due date input
-        if isinstance(due_date, str):
-            try:
-                due_date = datetime.strptime(due_date, '%Y-%m-%d').date()
-            except ValueError:
-                # Accept ISO strings with time component
-                try:
-                    due_date = datetime.fromisoformat(due_date).date()
-                except ValueError:
-                    due_date = None
-        elif isinstance(due_date, datetime):
-            due_date = due_date.date()
-        elif isinstance(due_date, date):
-            pass
-        else:
-            due_date = None
+            ScoredTask holding the task fields and scoring metadata
+        """
+        task_id, due_date, importance, estimated_hours, dependencies = (
+            self.normalize_task(task)
+        )
 
+        if today is None:
+            today = datetime.now().date()
         if due_date is None:
-            from datetime import timedelta
-            due_date = datetime.now().date() + timedelta(days=7)
-
-        importance = task.get('importance', 5) or 5
-        estimated_hours = task.get('estimated_hours', 2.0) or 2.0
-        dependencies = task.get('dependencies') or []
+            due_date = today + timedelta(days=7)
 
         # Calculate individual factor scores
-        urgency_score, days_until_due = self.calculate_urgency_score(due_date)
+        urgency_score, days_until_due = self.calculate_urgency_score(
+            due_date, today
+        )
         importance_score = self.calculate_importance_score(importance)
         effort_score = self.calculate_effort_score(estimated_hours)
-        dependency_score, dependent_count = self.calculate_dependency_score(
-            task_id, tasks
-        )
+        if dependent_counts is not None:
+            dependency_score, dependent_count = (
+                self.calculate_dependency_score_from_count(
+                    dependent_counts.get(task_id, 0)
+                )
+            )
+        else:
+            dependency_score, dependent_count = self.calculate_dependency_score(
+                task_id, tasks
+            )
         
         # Calculate weighted total score
+        w_urgency, w_importance, w_effort, w_dependency = self.weight_vector
         priority_score = (
-            self.weights['urgency'] * urgency_score +
-            self.weights['importance'] * importance_score +
-            self.weights['effort'] * effort_score +
-            self.weights['dependency'] * dependency_score
+            w_urgency * urgency_score +
+            w_importance * importance_score +
+            w_effort * effort_score +
+            w_dependency * dependency_score
         )
         
         # Generate explanation
-        explanation = self._generate_explanation(
-            urgency_score, 
-            importance_score, 
-            effort_score, 
-            dependency_score,
-            days_until_due,
-            dependent_count,
-            estimated_hours
-        )
+        if with_explanation:
+            explanation = self._generate_explanation(
+                urgency_score, 
+                importance_score, 
+                effort_score, 
+                dependency_score,
+                days_until_due,
+                dependent_count,
+                estimated_hours
+            )
+        else:
+            explanation = ''
         
         # Determine priority level
-        if priority_score >= 75:
-            priority_level = "High"
-        elif priority_score >= 50:
-            priority_level = "Medium"
-        else:
-            priority_level = "Low"
-        
-        # Return enriched task data
-        return {
-            **task,
-            'id': task_id,
-            'priority_score': round(priority_score, 2),
-            'urgency_score': round(urgency_score, 2),
-            'importance_score': round(importance_score, 2),
-            'effort_score': round(effort_score, 2),
-            'dependency_score': round(dependency_score, 2),
-            'explanation': explanation,
-            'priority_level': priority_level,
-            'days_until_due': days_until_due,
-            'due_date': due_date,
-            'estimated_hours': estimated_hours,
-            'importance': importance,
-            'dependencies': dependencies,
-        }
+        priority_level = _PRIORITY_LEVELS[
+            bisect_right(_PRIORITY_THRESHOLDS, priority_score)
+        ]
+        
+        return ScoredTask(
+            id=task_id,
+            title=task.get('title', ''),
+            due_date=due_date,
+            estimated_hours=estimated_hours,
+            importance=importance,
+            dependencies=dependencies,
+            priority_score=round(priority_score, 2),
+            urgency_score=round(urgency_score, 2),
+            importance_score=round(importance_score, 2),
+            effort_score=round(effort_score, 2),
+            dependency_score=round(dependency_score, 2),
+            explanation=explanation,
+            priority_level=priority_level,
+            days_until_due=days_until_due,
+            dependent_count=dependent_count,
+        )
+
+    def score_single(self, task: Dict[str, Any]) -> ScoredTask:
+        """
+        Score a task on its own, without a surrounding task list.
+        
+        Nothing can depend on an isolated task, so the dependency scan
+        over the cohort is skipped.
+        
+        Args:
+            task: Task dictionary to score
+            
+        Returns:
+            ScoredTask holding the task fields and scoring metadata
+        """
+        return self.score_task(task, ())
+
+    def explain(self, scored_task: ScoredTask) -> str:
+        """
+        Build the explanation for a task scored with ``with_explanation=False``.
+        """
+        return self._generate_explanation(
+            scored_task.urgency_score,
+            scored_task.importance_score,
+            scored_task.effort_score,
+            scored_task.dependency_score,
+            scored_task.days_until_due,
+            scored_task.dependent_count,
+            scored_task.estimated_hours
+        )
 
     def _generate_explanation(
         self,
@@ -375,10 +669,32 @@ class TaskScorer:
         
         return "Priority due to: " + ", ".join(reasons) + "."
 
+    def _score_checked(
+        self, 
+        tasks: List[Dict[str, Any]],
+        with_explanation: bool = True
+    ) -> Tuple[List[ScoredTask], Optional[str]]:
+        """
+        Reject empty or cyclic task lists, otherwise score them unsorted.
+        """
+        if not tasks:
+            return [], "No tasks provided"
+        
+        # Without any edges there is no cycle and nothing blocks anything
+        if not any(task.get('dependencies') for task in tasks):
+            return self.score_tasks(tasks, {}, with_explanation), None
+        
+        # The cycle check walks every edge once and counts dependents as it goes
+        has_cycle, cycle_path, dependent_counts = self.analyze_dependencies(tasks)
+        if has_cycle:
+            return [], f"Circular dependency detected: {' -> '.join(map(str, cycle_path))}"
+        
+        return self.score_tasks(tasks, dependent_counts, with_explanation), None
+
     def analyze_tasks(
         self, 
         tasks: List[Dict[str, Any]]
-    ) -> Tuple[List[Dict[str, Any]], str]:
+    ) -> Tuple[List[ScoredTask], Optional[str]]:
         """
         Analyze and sort tasks by priority.
         
@@ -388,25 +704,15 @@ class TaskScorer:
         Returns:
             Tuple of (sorted_tasks, error_message)
         """
-        if not tasks:
-            return [], "No tasks provided"
-        
-        # Check for circular dependencies
-        has_cycle, cycle_path = self.detect_circular_dependencies(tasks)
-        if has_cycle:
-            return [], f"Circular dependency detected: {' -> '.join(map(str, cycle_path))}"
-        
-        # Score all tasks
-        scored_tasks = [self.score_task(task, tasks) for task in tasks]
+        scored_tasks, error = self._score_checked(tasks)
+        if error:
+            return [], error
         
-        # Sort by priority score (descending)
-        sorted_tasks = sorted(
-            scored_tasks, 
-            key=lambda x: x['priority_score'], 
-            reverse=True
-        )
+        # Sort by priority score (descending), in place: the scored list is
+        # ours, and Timsort finishes an already-ordered list in one O(N) pass.
+        scored_tasks.sort(key=attrgetter('priority_score'), reverse=True)
         
-        return sorted_tasks, None
+        return scored_tasks, None
 
     def get_top_suggestions(
         self, 
@@ -423,18 +729,26 @@ class TaskScorer:
         Returns:
             List of suggestion dictionaries
         """
-        sorted_tasks, error = self.analyze_tasks(tasks)
+        # Explanations are only built for the tasks that are returned
+        scored_tasks, error = self._score_checked(tasks, with_explanation=False)
         
         if error:
             return []
         
-        top_tasks = sorted_tasks[:count]
+        # Only the top ``count`` are needed: O(N log K) instead of a full sort.
+        # Ties keep input order, exactly as with sorted(..., reverse=True).
+        top_tasks = heapq.nlargest(
+            count, 
+            scored_tasks, 
+            key=attrgetter('priority_score')
+        )
         
         suggestions = []
         for rank, task in enumerate(top_tasks, 1):
+            task.explanation = self.explain(task)
             suggestion = {
                 'task': task,
-                'score': task['priority_score'],
+                'score': task.priority_score,
                 'explanation': self._generate_detailed_suggestion(task, rank),
                 'rank': rank
             }
@@ -444,7 +758,7 @@ class TaskScorer:
 
     def _generate_detailed_suggestion(
         self, 
-        task: Dict[str, Any], 
+        task: ScoredTask, 
         rank: int
     ) -> str:
         """
@@ -452,13 +766,43 @@ class TaskScorer:
         """
         base = f"Suggestion #{rank}: "
         
-        if task['days_until_due'] < 0:
-            return base + f"This task is overdue and should be addressed immediately. {task['explanation']}"
+        if task.days_until_due < 0:
+            return base + f"This task is overdue and should be addressed immediately. {task.explanation}"
         
-        if task['days_until_due'] == 0:
-            return base + f"This task is due today. {task['explanation']}"
+        if task.days_until_due == 0:
+            return base + f"This task is due today. {task.explanation}"
         
-        if task['priority_score'] >= 75:
-            return base + f"High priority task. {task['explanation']}"
+        if task.priority_score >= 75:
+            return base + f"High priority task. {task.explanation}"
         
-        return base + f"Recommended based on balanced factors. {task['explanation']}"
\ No newline at end of file
+        return base + f"Recommended based on balanced factors. {task.explanation}"
+
+
+# One scorer per known strategy, built at import time
+_SCORERS = {name: TaskScorer(name) for name in TaskScorer.STRATEGIES}
+
+
+def get_scorer(strategy: str = 'smart_balance') -> TaskScorer:
+    """
+    Return the shared scorer for ``strategy``.
+    
+    Scorers hold no per-call state, so one instance per strategy is
+    reused across requests and threads. Unknown strategies get a fresh
+    scorer, which falls back to 'smart_balance' weights.
+    """
+    return _SCORERS.get(strategy) or TaskScorer(strategy)
+
+
+def warm_up() -> None:
+    """
+    Run every shared scorer over a small batch once, so the first real
+    request doesn't pay for first-call work such as the due-date parser.
+    """
+    today = date.today()
+    sample = [
+        {'id': 1, 'title': 'Warm-up', 'due_date': today.isoformat(), 'dependencies': []},
+        {'id': 2, 'title': 'Warm-up', 'due_date': today, 'dependencies': [1]},
+    ]
+    for scorer in _SCORERS.values():
+        scorer.analyze_tasks(sample)
+        scorer.get_top_suggestions(sample)
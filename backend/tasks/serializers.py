@@ -1,11 +1,27 @@
 """Serializers for validating task input and API payloads."""
 from rest_framework import serializers
-from datetime import datetime
+from datetime import date, datetime
+
+STRATEGY_CHOICES = (
+    'smart_balance',
+    'fastest_wins',
+    'high_impact',
+    'deadline_driven'
+)
+
+# Ids are bounded to the signed 64-bit range so responses can be encoded
+# by orjson, which rejects larger integers.
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
 
 
 class TaskSerializer(serializers.Serializer):
     """Validate and normalize a single task payload."""
-    id = serializers.IntegerField(required=False)
+    id = serializers.IntegerField(
+        required=False,
+        min_value=INT64_MIN,
+        max_value=INT64_MAX
+    )
     title = serializers.CharField(max_length=200)
     due_date = serializers.DateField(
         required=False,
@@ -25,7 +41,7 @@ class TaskSerializer(serializers.Serializer):
         max_value=10
     )
     dependencies = serializers.ListField(
-        child=serializers.IntegerField(),
+        child=serializers.IntegerField(min_value=INT64_MIN, max_value=INT64_MAX),
         required=False,
         default=list,
         allow_empty=True
@@ -62,16 +78,109 @@ class TaskSerializer(serializers.Serializer):
         return value
 
 
+def _is_int(value):
+    return (
+        isinstance(value, int) and not isinstance(value, bool)
+        and INT64_MIN <= value <= INT64_MAX
+    )
+
+
+def _fast_due_date(value):
+    """Parse a canonical YYYY-MM-DD string, or return None."""
+    if (
+        isinstance(value, str) and len(value) == 10 and value.isascii()
+        and value[4] == '-' and value[7] == '-'
+        and value[:4].isdigit() and value[5:7].isdigit() and value[8:].isdigit()
+    ):
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            return None
+    return None
+
+
+def _validate_task_fast(raw):
+    """
+    Validate one already well-typed task dict without DRF.
+    
+    Produces the same values as ``TaskSerializer`` but only accepts
+    canonical JSON types; returns None if anything needs coercion or is
+    invalid.
+    """
+    if not isinstance(raw, dict):
+        return None
+    
+    title = raw.get('title')
+    if not isinstance(title, str):
+        return None
+    title = title.strip()
+    if not title or len(title) > 200 or '\x00' in title:
+        return None
+    
+    task = {}
+    if 'id' in raw:
+        if not _is_int(raw['id']):
+            return None
+        task['id'] = raw['id']
+    task['title'] = title
+    
+    if 'due_date' in raw:
+        due_date = _fast_due_date(raw['due_date'])
+        if due_date is None:
+            return None
+        task['due_date'] = due_date
+    
+    hours = raw.get('estimated_hours', 2.0)
+    if isinstance(hours, bool) or not isinstance(hours, (int, float)):
+        return None
+    if not 0.1 <= hours <= 1000.0:
+        return None
+    task['estimated_hours'] = float(hours)
+    
+    importance = raw.get('importance', 5)
+    if not _is_int(importance) or not 1 <= importance <= 10:
+        return None
+    task['importance'] = importance
+    
+    dependencies = raw.get('dependencies', [])
+    if not isinstance(dependencies, list) or not all(map(_is_int, dependencies)):
+        return None
+    # Validation never mutates tasks, so the parsed list is shared, not copied
+    task['dependencies'] = dependencies
+    
+    return task
+
+
+def validate_tasks_bulk(raw_tasks):
+    """
+    Validate a list of task dicts, sending only the tasks the fast path
+    can't take through ``TaskSerializer``.
+    
+    Returns None if any task is invalid, so the caller can report every
+    error through ``TaskAnalysisRequestSerializer``.
+    """
+    validated = []
+    # One serializer validates every deferred task, as ListSerializer reuses
+    # its child, so its fields are bound (deep-copied) once per payload.
+    child = None
+    for raw in raw_tasks:
+        task = _validate_task_fast(raw)
+        if task is None:
+            if child is None:
+                child = TaskSerializer()
+            try:
+                task = child.run_validation(raw)
+            except serializers.ValidationError:
+                return None
+        validated.append(task)
+    return validated
+
+
 class TaskAnalysisRequestSerializer(serializers.Serializer):
     """Request body for analysis/suggestion endpoints."""
     tasks = TaskSerializer(many=True)
     strategy = serializers.ChoiceField(
-        choices=[
-            'smart_balance',
-            'fastest_wins',
-            'high_impact',
-            'deadline_driven'
-        ],
+        choices=STRATEGY_CHOICES,
         default='smart_balance',
         required=False
     )
@@ -100,4 +209,37 @@ class TaskSuggestionSerializer(serializers.Serializer):
     task = ScoredTaskSerializer()
     score = serializers.FloatField()
     explanation = serializers.CharField()
-    rank = serializers.IntegerField()
\ No newline at end of file
+    rank = serializers.IntegerField()
+
+
+def scored_task_to_dict(task):
+    """
+    Render a scored task exactly as ``ScoredTaskSerializer`` would, without
+    DRF's per-field dispatch.
+    """
+    return {
+        'id': int(task.id),
+        'title': str(task.title),
+        'due_date': task.due_date.isoformat(),
+        'estimated_hours': float(task.estimated_hours),
+        'importance': int(task.importance),
+        'dependencies': [int(dep) for dep in task.dependencies],
+        'priority_score': float(task.priority_score),
+        'urgency_score': float(task.urgency_score),
+        'importance_score': float(task.importance_score),
+        'effort_score': float(task.effort_score),
+        'dependency_score': float(task.dependency_score),
+        'explanation': str(task.explanation),
+        'priority_level': str(task.priority_level),
+        'days_until_due': int(task.days_until_due),
+    }
+
+
+def suggestion_to_dict(suggestion):
+    """Render a suggestion exactly as ``TaskSuggestionSerializer`` would."""
+    return {
+        'task': scored_task_to_dict(suggestion['task']),
+        'score': float(suggestion['score']),
+        'explanation': str(suggestion['explanation']),
+        'rank': int(suggestion['rank']),
+    }
@@ -0,0 +1,20 @@
+"""Signal handlers for the tasks app."""
+
+# WAL lets readers run alongside the writer and, with synchronous=NORMAL,
+# only fsyncs at checkpoints instead of on every commit.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL;",
+    "PRAGMA synchronous=NORMAL;",
+    "PRAGMA temp_store=MEMORY;",
+    "PRAGMA mmap_size=268435456;",
+    "PRAGMA cache_size=-64000;",
+)
+
+
+def configure_sqlite(sender, connection, **kwargs):
+    """Apply the SQLite PRAGMAs to every new connection."""
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
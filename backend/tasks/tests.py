@@ -8,9 +8,23 @@ Tests cover:
 - Strategy switching
 - API endpoint functionality
 """
+import json
+from unittest import mock
+
+from django.core.cache import cache
 from django.test import TestCase
 from datetime import datetime, timedelta, date
+from .models import Task
 from .scoring import TaskScorer
+from .serializers import (
+    ScoredTaskSerializer,
+    TaskSerializer,
+    TaskSuggestionSerializer,
+    scored_task_to_dict,
+    suggestion_to_dict,
+    _validate_task_fast,
+    validate_tasks_bulk
+)
 
 
 class TaskScorerTestCase(TestCase):
@@ -44,6 +58,18 @@ class TaskScorerTestCase(TestCase):
         self.assertGreaterEqual(urgency_score, 90)
         self.assertEqual(days_until_due, 0)
     
+    def test_urgency_uses_given_reference_date(self):
+        """
+        Test that urgency is measured from an explicit reference date.
+        """
+        due = self.today + timedelta(days=10)
+        urgency_score, days_until_due = self.scorer.calculate_urgency_score(
+            due, today=due - timedelta(days=1)
+        )
+        
+        self.assertEqual(days_until_due, 1)
+        self.assertEqual(urgency_score, 85)
+    
     def test_urgency_calculation_future(self):
         """
         Test urgency score for future tasks.
@@ -116,6 +142,23 @@ class TaskScorerTestCase(TestCase):
         self.assertFalse(has_cycle)
         self.assertEqual(len(cycle_path), 0)
     
+    def test_cycle_detection_handles_deep_chains(self):
+        """
+        Test that long dependency chains don't hit the recursion limit.
+        """
+        chain = [
+            {'id': i, 'title': f'Task {i}', 'dependencies': [i + 1]}
+            for i in range(5000)
+        ]
+        
+        has_cycle, cycle_path = self.scorer.detect_circular_dependencies(chain)
+        self.assertFalse(has_cycle)
+        
+        chain[-1]['dependencies'] = [4990]
+        has_cycle, cycle_path = self.scorer.detect_circular_dependencies(chain)
+        self.assertTrue(has_cycle)
+        self.assertEqual(cycle_path, list(range(4990, 5000)))
+    
     def test_dependency_score_calculation(self):
         """
         Test dependency scoring based on blocked tasks.
@@ -138,6 +181,49 @@ class TaskScorerTestCase(TestCase):
         
         self.assertEqual(dep_count_2, 0)
         self.assertLess(dep_score_2, 20)
+        
+        # Counting once for the batch gives the same scores
+        counts = self.scorer.count_dependents(tasks)
+        self.assertEqual(counts[1], 3)
+        self.assertEqual(
+            self.scorer.calculate_dependency_score_from_count(counts[1]),
+            (dep_score, dep_count)
+        )
+        
+        # The cycle check's walk produces the same counts
+        has_cycle, _, walk_counts = self.scorer.analyze_dependencies(tasks)
+        self.assertFalse(has_cycle)
+        self.assertEqual(walk_counts, counts)
+    
+    def test_batch_scoring_matches_per_task_scoring(self):
+        """
+        Test that batch scoring gives the same results as scoring one by one.
+        """
+        tasks = [
+            {'id': 1, 'title': 'Task 1', 'importance': 8, 'dependencies': []},
+            {'id': 2, 'title': 'Task 2', 'estimated_hours': 6, 'dependencies': [1]},
+            {'id': 3, 'title': 'Task 3', 'dependencies': [1, 2, 1]},
+            {'id': 4, 'title': 'Task 4', 'dependencies': [1]}
+        ]
+        
+        self.assertEqual(
+            self.scorer.score_tasks(tasks),
+            [self.scorer.score_task(task, tasks) for task in tasks]
+        )
+    
+    def test_independent_tasks_skip_dependency_walk(self):
+        """
+        Test that tasks without dependencies score as if counted in full.
+        """
+        tasks = [
+            {'id': 1, 'title': 'Task 1', 'importance': 8},
+            {'id': 2, 'title': 'Task 2', 'dependencies': []}
+        ]
+        
+        scored_tasks, error = self.scorer._score_checked(tasks)
+        
+        self.assertIsNone(error)
+        self.assertEqual(scored_tasks, self.scorer.score_tasks(tasks))
     
     def test_complete_task_scoring(self):
         """
@@ -176,6 +262,36 @@ class TaskScorerTestCase(TestCase):
         # High urgency + high importance should yield high priority
         self.assertGreater(scored_task['priority_score'], 60)
     
+    def test_score_single_matches_self_cohort(self):
+        """
+        Test that scoring a lone task matches scoring it against itself.
+        """
+        task = {
+            'id': 1,
+            'title': 'Solo task',
+            'due_date': self.today + timedelta(days=2),
+            'estimated_hours': 1,
+            'importance': 6,
+            'dependencies': []
+        }
+        
+        self.assertEqual(
+            self.scorer.score_single(task),
+            self.scorer.score_task(task, [task])
+        )
+    
+    def test_scored_task_supports_item_access(self):
+        """
+        Test that scored tasks read the same by attribute and by key.
+        """
+        scored_task = self.scorer.score_single({'title': 'Keyed task'})
+    
+        self.assertEqual(scored_task['priority_score'], scored_task.priority_score)
+        self.assertEqual(scored_task['title'], 'Keyed task')
+        self.assertNotIn('description', scored_task)
+        with self.assertRaises(KeyError):
+            scored_task['description']
+    
     def test_strategy_switching(self):
         """
         Test that different strategies produce different scores.
@@ -270,6 +386,21 @@ class TaskScorerTestCase(TestCase):
         except Exception as e:
             self.fail(f"Scoring with minimal data raised exception: {e}")
     
+    def test_normalize_task_parses_due_dates(self):
+        """
+        Test that due dates are accepted as strings, datetimes and dates.
+        """
+        expected = date(2025, 11, 30)
+        for due in ('2025-11-30', '2025-11-30T09:30:00', datetime(2025, 11, 30, 9), expected):
+            _, due_date, _, _, _ = self.scorer.normalize_task({'title': 'T', 'due_date': due})
+            self.assertEqual(due_date, expected)
+        
+        _, due_date, importance, hours, deps = self.scorer.normalize_task(
+            {'title': 'T', 'due_date': 'soon', 'dependencies': None}
+        )
+        self.assertIsNone(due_date)
+        self.assertEqual((importance, hours, deps), (5, 2.0, []))
+    
     def test_top_suggestions(self):
         """
         Test suggestion generation for top tasks.
@@ -313,4 +444,349 @@ class TaskScorerTestCase(TestCase):
             self.assertIn('rank', suggestion)
         
         # First suggestion should have rank 1
-        self.assertEqual(suggestions[0]['rank'], 1)
\ No newline at end of file
+        self.assertEqual(suggestions[0]['rank'], 1)
+
+
+class TaskValidationTestCase(TestCase):
+    """
+    Test suite for the plain-Python bulk task validator.
+    """
+    
+    def test_fast_validation_matches_serializer(self):
+        """
+        Test that well-typed payloads validate to the same data as DRF.
+        """
+        raw_tasks = [
+            {'id': 1, 'title': '  Fix bug  ', 'due_date': '2025-11-30',
+             'estimated_hours': 3, 'importance': 8, 'dependencies': [2]},
+            {'id': 2, 'title': 'Minimal'},
+            {'title': 'No id', 'estimated_hours': 0.5, 'extra': 'ignored'},
+        ]
+        serializer = TaskSerializer(data=raw_tasks, many=True)
+        self.assertTrue(serializer.is_valid())
+        
+        # Well-typed tasks never reach DRF
+        with mock.patch('tasks.serializers.TaskSerializer') as drf_serializer:
+            fast = validate_tasks_bulk(raw_tasks)
+        
+        drf_serializer.assert_not_called()
+        self.assertEqual(fast, [dict(task) for task in serializer.validated_data])
+    
+    def test_fast_validation_defers_to_serializer(self):
+        """
+        Test that anything needing coercion or reporting is left to DRF.
+        """
+        self.assertIsNone(_validate_task_fast({'title': ''}))
+        self.assertIsNone(_validate_task_fast({'title': 'T', 'importance': '5'}))
+        self.assertIsNone(_validate_task_fast({'title': 'T', 'importance': 11}))
+        self.assertIsNone(_validate_task_fast({'title': 'T', 'due_date': '2025-1-5'}))
+        self.assertIsNone(_validate_task_fast({'title': 'T', 'dependencies': [True]}))
+        self.assertIsNone(_validate_task_fast('not a dict'))
+    
+    def test_bulk_validation_only_defers_odd_tasks(self):
+        """
+        Test that mixed payloads validate like DRF without failing over whole.
+        """
+        raw_tasks = [
+            {'id': 1, 'title': 'Typed', 'importance': 7},
+            {'id': '2', 'title': 'Stringly', 'importance': '3', 'due_date': '2025-1-5'},
+        ]
+        serializer = TaskSerializer(data=raw_tasks, many=True)
+        self.assertTrue(serializer.is_valid())
+        
+        self.assertEqual(
+            validate_tasks_bulk(raw_tasks),
+            [dict(task) for task in serializer.validated_data]
+        )
+        self.assertIsNone(validate_tasks_bulk(raw_tasks + [{'title': ''}]))
+    
+    def test_fast_output_matches_serializers(self):
+        """
+        Test that the direct output shaping renders exactly like DRF.
+        """
+        scorer = TaskScorer()
+        tasks = [
+            {'id': 1, 'title': 'Fix bug', 'due_date': date(2025, 11, 30),
+             'estimated_hours': 3.0, 'importance': 8, 'dependencies': []},
+            {'title': 'No id', 'dependencies': [1]},
+        ]
+        sorted_tasks, _ = scorer.analyze_tasks(tasks)
+        suggestions = scorer.get_top_suggestions(tasks)
+        
+        self.assertEqual(
+            [scored_task_to_dict(task) for task in sorted_tasks],
+            ScoredTaskSerializer(sorted_tasks, many=True).data
+        )
+        self.assertEqual(
+            [suggestion_to_dict(item) for item in suggestions],
+            TaskSuggestionSerializer(suggestions, many=True).data
+        )
+
+
+class TaskModelTestCase(TestCase):
+    """
+    Test suite for Task persistence and score caching.
+    """
+    
+    def test_bulk_create_scored_matches_save(self):
+        """
+        Test that bulk-created tasks get the same score as saved ones.
+        """
+        saved = Task(title='Write report', description='Quarterly numbers')
+        saved.save()
+        
+        Task.objects.bulk_create_scored([
+            Task(title='Write report', description='Quarterly numbers'),
+            Task(title='Another task'),
+        ])
+        
+        bulk = Task.objects.filter(title='Write report').exclude(pk=saved.pk).get()
+        self.assertGreater(bulk.complexity_score, 0)
+        self.assertFalse(bulk.score_dirty)
+        self.assertEqual(bulk.complexity_score, saved.get_complexity_score())
+        self.assertEqual(Task.objects.count(), 3)
+    
+    def test_prepare_scored_builds_clean_unsaved_tasks(self):
+        """
+        Test that prepared tasks carry a score and are not yet persisted.
+        """
+        tasks = Task.prepare_scored([
+            {'title': 'Deploy'},
+            {'title': 'Review PR', 'description': 'Backend changes'},
+        ])
+        
+        self.assertEqual(len(tasks), 2)
+        for task in tasks:
+            self.assertIsNone(task.pk)
+            self.assertFalse(task.score_dirty)
+            self.assertGreater(task.complexity_score, 0)
+    
+    def test_complexity_score_is_computed_lazily(self):
+        """
+        Test that saves only mark the score stale and reads refresh it.
+        """
+        task = Task(title='Plan sprint')
+        task.save()
+        self.assertTrue(Task.objects.get(pk=task.pk).score_dirty)
+        
+        score = Task.objects.get(pk=task.pk).get_complexity_score()
+        stored = Task.objects.get(pk=task.pk)
+        self.assertFalse(stored.score_dirty)
+        self.assertEqual(stored.complexity_score, score)
+        
+        # Status-only changes keep the stored score
+        stored.status = 'DONE'
+        stored.save()
+        self.assertFalse(Task.objects.get(pk=task.pk).score_dirty)
+        
+        # Changing a scoring field invalidates it again
+        stored.title = 'Plan next sprint'
+        stored.save(update_fields=['title'])
+        self.assertTrue(Task.objects.get(pk=task.pk).score_dirty)
+    
+    def test_str_does_not_write_the_score(self):
+        """
+        Test that rendering a stale task shows its score without saving it.
+        """
+        task = Task(title='Plan sprint')
+        task.save()
+        stale = Task.objects.get(pk=task.pk)
+        
+        with self.assertNumQueries(0):
+            text = str(stale)
+        
+        self.assertEqual(text, f'Plan sprint (Score: {stale.compute_complexity_score()})')
+        self.assertTrue(Task.objects.get(pk=task.pk).score_dirty)
+
+
+class TaskAPITestCase(TestCase):
+    """
+    Test suite for the analyze and suggest endpoints.
+    """
+    
+    def setUp(self):
+        """
+        Set up a small valid payload and start from an empty cache.
+        """
+        cache.clear()
+        today = datetime.now().date()
+        self.payload = {
+            'tasks': [
+                {'id': 1, 'title': 'Fix login bug', 'due_date': str(today),
+                 'estimated_hours': 1, 'importance': 9, 'dependencies': []},
+                {'id': 2, 'title': 'Write docs', 'due_date': str(today + timedelta(days=10)),
+                 'estimated_hours': 4, 'importance': 4, 'dependencies': [1]},
+            ],
+            'strategy': 'smart_balance'
+        }
+    
+    def test_suggest_reuses_cached_result(self):
+        """
+        Test that identical suggestion requests return identical results.
+        """
+        first = self.client.post(
+            '/api/v1/tasks/suggest/', self.payload, content_type='application/json'
+        )
+        second = self.client.post(
+            '/api/v1/tasks/suggest/', self.payload, content_type='application/json'
+        )
+        
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.json()['suggestion_count'], 2)
+        self.assertEqual(first.json()['suggestions'][0]['task']['id'], 1)
+        self.assertEqual(first.json()['suggestions'], second.json()['suggestions'])
+    
+    def test_analyze_returns_sorted_json(self):
+        """
+        Test the analyze endpoint response shape and ordering.
+        """
+        response = self.client.post(
+            '/api/v1/tasks/analyze/', self.payload, content_type='application/json'
+        )
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        body = response.json()
+        self.assertEqual(body['total_tasks'], 2)
+        self.assertEqual([t['id'] for t in body['sorted_tasks']], [1, 2])
+        self.assertEqual(body['sorted_tasks'][0]['due_date'], self.payload['tasks'][0]['due_date'])
+    
+    def test_invalid_task_reports_field_errors(self):
+        """
+        Test that validation errors are returned as a 400 with details.
+        """
+        self.payload['tasks'][1]['dependencies'] = ['not-an-id']
+        response = self.client.post(
+            '/api/v1/tasks/analyze/', self.payload, content_type='application/json'
+        )
+        
+        self.assertEqual(response.status_code, 400)
+        details = response.json()['details']
+        self.assertIn('dependencies', details['tasks'][1])
+    
+    def test_ids_beyond_64_bits_are_rejected(self):
+        """
+        Test that ids too large to encode are a 400, not a server error.
+        """
+        self.payload['tasks'][0]['id'] = '99999999999999999999999'
+        response = self.client.post(
+            '/api/v1/tasks/analyze/', self.payload, content_type='application/json'
+        )
+        
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('id', response.json()['details']['tasks'][0])
+        
+        body = (
+            b'{"tasks": [{"title": "x", "dependencies": [18446744073709551615]}]}'
+        )
+        response = self.client.post(
+            '/api/v1/tasks/analyze/', body, content_type='application/json'
+        )
+        
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('dependencies', response.json()['details']['tasks'][0])
+        
+    def test_suggest_get_matches_post(self):
+        """
+        Test that GET suggestions validate tasks the same way as POST.
+        """
+        post = self.client.post(
+            '/api/v1/tasks/suggest/', self.payload, content_type='application/json'
+        )
+        get = self.client.get('/api/v1/tasks/suggest/', {
+            'tasks': json.dumps(self.payload['tasks']),
+            'strategy': 'smart_balance'
+        })
+        
+        self.assertEqual(get.status_code, 200)
+        self.assertEqual(get.json()['suggestions'], post.json()['suggestions'])
+        
+        bad = self.client.get('/api/v1/tasks/suggest/', {
+            'tasks': json.dumps([{'title': 'No importance', 'importance': 'high'}])
+        })
+        self.assertEqual(bad.status_code, 400)
+        self.assertIn('importance', bad.json()['details']['tasks'][0])
+    
+    def test_analyze_honours_requested_indent(self):
+        """
+        Test that an indent in the Accept header pretty-prints the response.
+        """
+        compact = self.client.post(
+            '/api/v1/tasks/analyze/', self.payload, content_type='application/json'
+        )
+        indented = self.client.post(
+            '/api/v1/tasks/analyze/', self.payload, content_type='application/json',
+            HTTP_ACCEPT='application/json; indent=4'
+        )
+        
+        self.assertNotIn(b'\n', compact.content)
+        self.assertIn(b'\n  "sorted_tasks"', indented.content)
+        self.assertEqual(indented.json()['sorted_tasks'], compact.json()['sorted_tasks'])
+    
+    def test_errors_use_api_error_bodies(self):
+        """
+        Test that malformed JSON is a 400 and unexpected failures a 500.
+        """
+        response = self.client.post(
+            '/api/v1/tasks/analyze/', '{"tasks": [', content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 400)
+        
+        with mock.patch('tasks.views.get_scorer', side_effect=RuntimeError('boom')):
+            response = self.client.post(
+                '/api/v1/tasks/analyze/', self.payload, content_type='application/json'
+            )
+        
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(
+            response.json(), {'error': 'Internal server error', 'details': 'boom'}
+        )
+    
+    def test_health_check(self):
+        """
+        Test that the health probe answers with a short-lived JSON body.
+        """
+        response = self.client.get('/api/v1/health/')
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertIn('max-age=1', response['Cache-Control'])
+        self.assertEqual(response.json()['status'], 'healthy')
+    
+    def test_analyze_reuses_cached_result(self):
+        """
+        Test that a repeated analysis is served without rescoring.
+        """
+        first = self.client.post(
+            '/api/v1/tasks/analyze/', self.payload, content_type='application/json'
+        )
+        with mock.patch('tasks.views._analyze') as analyze:
+            second = self.client.post(
+                '/api/v1/tasks/analyze/', self.payload, content_type='application/json'
+            )
+        
+        analyze.assert_not_called()
+        self.assertEqual(first.json()['sorted_tasks'], second.json()['sorted_tasks'])
+    
+    def test_large_analysis_is_streamed(self):
+        """
+        Test that large analyses are streamed, uncached, with the buffered body.
+        """
+        buffered = self.client.post(
+            '/api/v1/tasks/analyze/', self.payload, content_type='application/json'
+        ).json()
+        cache.clear()
+        with mock.patch('tasks.views.STREAMING_MIN_TASKS', 1), \
+                mock.patch('tasks.views.STREAMING_CHUNK_TASKS', 1), \
+                mock.patch('tasks.views.cache') as result_cache:
+            response = self.client.post(
+                '/api/v1/tasks/analyze/', self.payload, content_type='application/json'
+            )
+        
+        # Results this large bypass the result cache
+        result_cache.get_or_set.assert_not_called()
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        streamed = json.loads(b''.join(response.streaming_content))
+        del buffered['analysis_timestamp'], streamed['analysis_timestamp']
+        self.assertEqual(streamed, buffered)
@@ -1,192 +1,294 @@
 """REST API endpoints for analyzing and suggesting tasks."""
+import hashlib
+import time
+
+import orjson
+from django.core.cache import cache
+from django.http import HttpResponse, StreamingHttpResponse
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import require_safe
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework import status
 from .serializers import (
+    STRATEGY_CHOICES,
     TaskAnalysisRequestSerializer,
-    ScoredTaskSerializer,
-    TaskSuggestionSerializer
+    scored_task_to_dict,
+    suggestion_to_dict,
+    validate_tasks_bulk
 )
-from .scoring import TaskScorer
+from .scoring import get_scorer
 from datetime import datetime, timedelta
 
+# Analyses with at least this many tasks are streamed, this many per chunk.
+STREAMING_MIN_TASKS = 1000
+STREAMING_CHUNK_TASKS = 500
+
+# Number of suggestions returned by suggest_tasks.
+SUGGESTION_COUNT = 3
+
+# Success messages, built once; analyze messages are filled in with the task count.
+_ANALYZE_MESSAGES = {
+    strategy: f'Successfully analyzed {{}} tasks using {strategy} strategy'
+    for strategy in STRATEGY_CHOICES
+}
+_SUGGEST_MESSAGES = tuple(
+    f'Top {count} task recommendations for today'
+    for count in range(SUGGESTION_COUNT + 1)
+)
+
+# Response timestamps are reused for up to this many seconds.
+TIMESTAMP_RESOLUTION = 0.25
+
+# (time.time() when formatted, ISO string); replaced as a whole, so
+# concurrent readers always see a matching pair.
+_timestamp = (0.0, '')
+
+
+def _now_iso():
+    """
+    Return the current local time in ISO format, reformatted at most once
+    every TIMESTAMP_RESOLUTION seconds.
+    """
+    global _timestamp
+    now = time.time()
+    stamp = _timestamp
+    if now - stamp[0] >= TIMESTAMP_RESOLUTION:
+        stamp = _timestamp = (now, datetime.fromtimestamp(now).isoformat())
+    return stamp[1]
+
+
+def _tasks_cache_key(prefix, strategy, tasks):
+    """
+    Build a cache key from the strategy, the validated tasks and today's
+    date (urgency is relative to today, so results expire at midnight).
+    """
+    payload = orjson.dumps(tasks, option=orjson.OPT_SORT_KEYS)
+    digest = hashlib.sha1(
+        f'{strategy}|{datetime.now().date()}|'.encode() + payload
+    ).hexdigest()
+    return f'{prefix}:{digest}'
+
+
+def _analyze(scorer, tasks):
+    """
+    Score and sort tasks, shaping them directly into the same output as
+    ScoredTaskSerializer.
+    
+    Returns:
+        Tuple of (sorted task dicts, error message or None)
+    """
+    sorted_tasks, error = scorer.analyze_tasks(tasks)
+    return [scored_task_to_dict(task) for task in sorted_tasks], error
+
+
+def _stream_analysis(body):
+    """
+    Yield ``body`` as JSON bytes, encoding ``sorted_tasks`` a chunk at a
+    time so the first bytes go out before the whole list is encoded.
+    """
+    sorted_tasks = body['sorted_tasks']
+    yield b'{"sorted_tasks":['
+    for start in range(0, len(sorted_tasks), STREAMING_CHUNK_TASKS):
+        if start:
+            yield b','
+        # Strip the brackets so the chunks join into one array
+        yield orjson.dumps(sorted_tasks[start:start + STREAMING_CHUNK_TASKS])[1:-1]
+    trailer = {key: value for key, value in body.items() if key != 'sorted_tasks'}
+    yield b'],' + orjson.dumps(trailer)[1:]
+
+
+def _validate_request(data):
+    """
+    Validate an analysis request body.
+    
+    Returns:
+        Tuple of (tasks, strategy, errors); errors is None when valid
+    """
+    # Well-typed tasks skip DRF's per-field validation and only the rest go
+    # through TaskSerializer; invalid payloads are re-run through the full
+    # request serializer for its error messages.
+    raw_tasks = data.get('tasks') if isinstance(data, dict) else None
+    if isinstance(raw_tasks, list):
+        strategy = data.get('strategy', 'smart_balance')
+        if strategy in STRATEGY_CHOICES:
+            tasks = validate_tasks_bulk(raw_tasks)
+            if tasks is not None:
+                return tasks, strategy, None
+    
+    serializer = TaskAnalysisRequestSerializer(data=data)
+    if not serializer.is_valid():
+        return None, None, serializer.errors
+    
+    validated_data = serializer.validated_data
+    return validated_data['tasks'], validated_data.get('strategy', 'smart_balance'), None
+
 
 @api_view(['POST'])
 def analyze_tasks(request):
     """Validate tasks and return them sorted by computed priority."""
-    try:
-        # Validate incoming data
-        serializer = TaskAnalysisRequestSerializer(data=request.data)
-        
-        if not serializer.is_valid():
-            return Response(
-                {
-                    'error': 'Invalid request data',
-                    'details': serializer.errors
-                },
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        validated_data = serializer.validated_data
-        tasks = validated_data['tasks']
-        strategy = validated_data.get('strategy', 'smart_balance')
-        
-        # Handle empty task list
-        if not tasks:
-            return Response(
-                {
-                    'error': 'No tasks provided',
-                    'sorted_tasks': [],
-                    'strategy_used': strategy,
-                    'total_tasks': 0
-                },
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        # Initialize scorer with selected strategy
-        scorer = TaskScorer(strategy=strategy)
-        
-        # Analyze and sort tasks
-        sorted_tasks, error = scorer.analyze_tasks(tasks)
-        
-        if error:
-            return Response(
-                {
-                    'error': error,
-                    'sorted_tasks': [],
-                    'strategy_used': strategy
-                },
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        # Serialize scored tasks
-        result_serializer = ScoredTaskSerializer(sorted_tasks, many=True)
-        
+    # Validate incoming data
+    tasks, strategy, errors = _validate_request(request.data)
+    
+    if errors is not None:
         return Response(
             {
-                'sorted_tasks': result_serializer.data,
+                'error': 'Invalid request data',
+                'details': errors
+            },
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    # Handle empty task list
+    if not tasks:
+        return Response(
+            {
+                'error': 'No tasks provided',
+                'sorted_tasks': [],
                 'strategy_used': strategy,
-                'total_tasks': len(sorted_tasks),
-                'analysis_timestamp': datetime.now().isoformat(),
-                'message': f'Successfully analyzed {len(sorted_tasks)} tasks using {strategy} strategy'
+                'total_tasks': 0
             },
-            status=status.HTTP_200_OK
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    # Shared scorer for the selected strategy
+    scorer = get_scorer(strategy)
+    
+    # Analyze and sort tasks, reusing the shaped result for an identical task
+    # set. Streamed-size results are not cached: each entry would hold
+    # megabytes and every hit would unpickle the whole list.
+    if len(tasks) >= STREAMING_MIN_TASKS:
+        sorted_tasks, error = _analyze(scorer, tasks)
+    else:
+        sorted_tasks, error = cache.get_or_set(
+            _tasks_cache_key('analyze', strategy, tasks),
+            lambda: _analyze(scorer, tasks)
         )
     
-    except Exception as e:
+    if error:
         return Response(
             {
-                'error': 'Internal server error',
-                'details': str(e)
+                'error': error,
+                'sorted_tasks': [],
+                'strategy_used': strategy
             },
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            status=status.HTTP_400_BAD_REQUEST
         )
+    
+    body = {
+        'sorted_tasks': sorted_tasks,
+        'strategy_used': strategy,
+        'total_tasks': len(sorted_tasks),
+        'analysis_timestamp': _now_iso(),
+        'message': _ANALYZE_MESSAGES[strategy].format(len(sorted_tasks))
+    }
+    
+    # Large results are streamed rather than encoded into one buffer
+    if len(sorted_tasks) >= STREAMING_MIN_TASKS:
+        return StreamingHttpResponse(
+            _stream_analysis(body), content_type='application/json'
+        )
+    
+    return Response(body, status=status.HTTP_200_OK)
 
 
 @api_view(['GET', 'POST'])
 def suggest_tasks(request):
     """Return the top N task suggestions with short explanations."""
-    try:
-        # Handle both GET and POST requests
-        if request.method == 'POST':
-            serializer = TaskAnalysisRequestSerializer(data=request.data)
-            
-            if not serializer.is_valid():
-                return Response(
-                    {
-                        'error': 'Invalid request data',
-                        'details': serializer.errors
-                    },
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-            
-            validated_data = serializer.validated_data
-            tasks = validated_data['tasks']
-            strategy = validated_data.get('strategy', 'smart_balance')
-        
-        else:  # GET request
-            import json
-            
-            strategy = request.GET.get('strategy', 'smart_balance')
-            tasks_json = request.GET.get('tasks', '[]')
-            
-            try:
-                tasks = json.loads(tasks_json)
-            except json.JSONDecodeError:
-                return Response(
-                    {
-                        'error': 'Invalid tasks JSON format'
-                    },
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-            
-            # Validate tasks if provided
-            if tasks:
-                task_serializer = TaskAnalysisRequestSerializer(
-                    data={'tasks': tasks, 'strategy': strategy}
-                )
-                
-                if not task_serializer.is_valid():
-                    return Response(
-                        {
-                            'error': 'Invalid task data',
-                            'details': task_serializer.errors
-                        },
-                        status=status.HTTP_400_BAD_REQUEST
-                    )
-                
-                tasks = task_serializer.validated_data['tasks']
+    # Handle both GET and POST requests
+    if request.method == 'POST':
+        tasks, strategy, errors = _validate_request(request.data)
         
-        # Handle empty task list
-        if not tasks:
+        if errors is not None:
             return Response(
                 {
-                    'suggestions': [],
-                    'strategy_used': strategy,
-                    'suggestion_count': 0,
-                    'message': 'No tasks available for suggestions'
+                    'error': 'Invalid request data',
+                    'details': errors
                 },
-                status=status.HTTP_200_OK
+                status=status.HTTP_400_BAD_REQUEST
             )
+    
+    else:  # GET request
+        strategy = request.GET.get('strategy', 'smart_balance')
+        tasks_json = request.GET.get('tasks', '[]')
         
-        # Initialize scorer
-        scorer = TaskScorer(strategy=strategy)
-        
-        # Get top suggestions
-        suggestions = scorer.get_top_suggestions(tasks, count=3)
-        
-        # Serialize suggestions
-        result_serializer = TaskSuggestionSerializer(suggestions, many=True)
+        try:
+            tasks = orjson.loads(tasks_json)
+        except orjson.JSONDecodeError:
+            return Response(
+                {
+                    'error': 'Invalid tasks JSON format'
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
+        # Validate tasks if provided, in a single pass like POST bodies
+        if tasks:
+            tasks, strategy, errors = _validate_request(
+                {'tasks': tasks, 'strategy': strategy}
+            )
+            
+            if errors is not None:
+                return Response(
+                    {
+                        'error': 'Invalid task data',
+                        'details': errors
+                    },
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+    
+    # Handle empty task list
+    if not tasks:
         return Response(
             {
-                'suggestions': result_serializer.data,
+                'suggestions': [],
                 'strategy_used': strategy,
-                'suggestion_count': len(suggestions),
-                'generated_at': datetime.now().isoformat(),
-                'message': f'Top {len(suggestions)} task recommendations for today'
+                'suggestion_count': 0,
+                'message': 'No tasks available for suggestions'
             },
             status=status.HTTP_200_OK
         )
     
-    except Exception as e:
-        return Response(
-            {
-                'error': 'Internal server error',
-                'details': str(e)
-            },
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
+    # Shared scorer for the selected strategy
+    scorer = get_scorer(strategy)
+    
+    # Get top suggestions, reusing results for an identical task set
+    suggestions = cache.get_or_set(
+        _tasks_cache_key('suggest', strategy, tasks),
+        lambda: scorer.get_top_suggestions(tasks, count=SUGGESTION_COUNT)
+    )
+    
+    # Shape the suggestions directly; same output as TaskSuggestionSerializer
+    return Response(
+        {
+            'suggestions': [suggestion_to_dict(item) for item in suggestions],
+            'strategy_used': strategy,
+            'suggestion_count': len(suggestions),
+            'generated_at': _now_iso(),
+            'message': _SUGGEST_MESSAGES[len(suggestions)]
+        },
+        status=status.HTTP_200_OK
+    )
 
 
-@api_view(['GET'])
+# (whole second, rendered body) for health_check; rebuilt once per second.
+_health_body = (0, b'')
+
+
+@require_safe
+@cache_control(max_age=1)
 def health_check(request):
-    """Simple health check endpoint."""
-    return Response(
-        {
+    """
+    Health probe served as a plain Django view, skipping DRF's request
+    wrapping and content negotiation.
+    """
+    global _health_body
+    second = int(time.time())
+    body = _health_body
+    if body[0] != second:
+        body = _health_body = (second, orjson.dumps({
             'status': 'healthy',
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': _now_iso(),
             'message': 'Smart Task Analyzer API is running'
-        },
-        status=status.HTTP_200_OK
-    )
\ No newline at end of file
+        }))
+    return HttpResponse(body[1], content_type='application/json')